@@ -3,11 +3,17 @@ Sentinel RAG - Professional Streamlit Interface
 Enterprise-Grade RAG with Document Management and Intelligent Search
 """
 
+import html
 import os
+import re
+import shutil
 import sys
 import tempfile
+import time
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
 
 # Add src to path (go up one level from app folder, then into src)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -17,17 +23,21 @@ from sentinel_rag.services.database.database import DatabaseManager
 from sentinel_rag.core.engine import SentinelEngine
 
 
-# Page configuration
-st.set_page_config(
-    page_title="Sentinel RAG",
-    page_icon="🛡️",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+CLASSIFICATION_OPTIONS = ("public", "internal", "confidential")
 
-# Custom CSS for professional styling
-st.markdown(
-    """
+# Search results rendered before the "show more" expander
+INITIAL_RESULTS = 5
+
+# Documents listed per page in the document library
+DOCS_PAGE_SIZE = 20
+
+CLASSIFICATION_COLORS = {
+    "public": "🟢",
+    "internal": "🟡",
+    "confidential": "🔴",
+}
+
+CUSTOM_CSS = """
 <style>
     /* Main container styling */
     .main {
@@ -58,15 +68,18 @@ st.markdown(
     }
     
     /* Card styling */
-    .metric-card {
+    .metric-card, .result-card {
         background: white;
         padding: 1.5rem;
         border-radius: 8px;
         box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        border-left: 4px solid #667eea;
         margin-bottom: 1rem;
     }
     
+    .metric-card {
+        border-left: 4px solid #667eea;
+    }
+    
     /* Document card styling */
     .doc-card {
         background: #f8f9fa;
@@ -84,14 +97,19 @@ st.markdown(
     
     /* Result card styling */
     .result-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 8px;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
         border-left: 4px solid #48bb78;
     }
     
+    .result-body {
+        display: grid;
+        grid-template-columns: 1fr 2fr;
+        gap: 1rem;
+    }
+    
+    .result-body pre {
+        white-space: pre-wrap;
+    }
+    
     /* Button styling */
     .stButton>button {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -109,18 +127,17 @@ st.markdown(
     }
     
     /* Sidebar styling */
-    .sidebar .sidebar-content {
+    [data-testid="stSidebar"] {
         background: #f8f9fa;
     }
     
     /* Success/Error message styling */
-    .stSuccess, .stError, .stWarning, .stInfo {
+    [data-testid="stAlert"] {
         border-radius: 8px;
     }
     
     /* Hide streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
+    #MainMenu, footer {visibility: hidden;}
     
     /* Tab styling */
     .stTabs [data-baseweb="tab-list"] {
@@ -132,17 +149,85 @@ st.markdown(
         font-weight: 600;
     }
 </style>
-""",
-    unsafe_allow_html=True,
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
+
+# Sent on every rerun, so ship it without comments and indentation
+CUSTOM_CSS_MIN = _minify_css(CUSTOM_CSS)
+
+HEADER_HTML = """
+<div class="header-container">
+    <h1 class="header-title">🛡️ Sentinel RAG</h1>
+    <p class="header-subtitle">Enterprise-Grade RAG with Intelligent Document Management & Semantic Search</p>
+</div>
+"""
+
+DOC_CARD_TEMPLATE = """
+<div class="doc-card">
+    <h4>📄 {title}</h4>
+    <p style="color: #666; margin: 0.5rem 0;">{description}</p>
+    <small style="color: #999;">Uploaded: {uploaded}</small>
+    <p style="margin: 0.5rem 0 0;">
+        <b>Department:</b> {department} &nbsp;|&nbsp;
+        <b>Classification:</b> {classification_icon} {classification} &nbsp;|&nbsp;
+        <i>Contains {chunk_count} chunks</i>
+    </p>
+</div>
+"""
+
+RESULT_CARD_TEMPLATE = """
+<div class="result-card">
+    <h4>📄 Result {idx}: {title}</h4>
+    <div class="result-body">
+        <div>
+            <b>Metadata:</b>
+            <ul>
+                <li><b>Department:</b> {department}</li>
+                <li><b>Classification:</b> {classification}</li>
+                <li><b>Similarity:</b> {similarity:.2%}</li>{ids}
+            </ul>
+        </div>
+        <div>
+            <b>Content:</b>
+            <pre>{content}</pre>
+        </div>
+    </div>
+</div>
+"""
+
+ID_ITEM_TEMPLATE = "<li><b>{}:</b> <code>{}</code></li>"
+RESULT_ID_FIELDS = (("Chunk ID", "chunk_id"), ("Parent ID", "parent_chunk_id"))
+
+
+# Page configuration
+st.set_page_config(
+    page_title="Sentinel RAG",
+    page_icon="🛡️",
+    layout="wide",
+    initial_sidebar_state="expanded",
 )
 
+# Custom CSS for professional styling
+st.markdown(CUSTOM_CSS_MIN, unsafe_allow_html=True)
+
 
 @st.cache_resource
 def initialize_system():
     """Initialize database and engine (cached for performance)"""
     try:
         settings = get_settings()
-        db = DatabaseManager(settings.database.dsn)
+        db = DatabaseManager(
+            settings.database.dsn,
+            min_pool_size=settings.database.min_pool_size,
+            max_pool_size=settings.database.max_pool_size,
+        )
         engine = SentinelEngine(
             db=db,
             rbac_config=settings.rbac.as_dict,
@@ -156,52 +241,120 @@ def initialize_system():
         st.stop()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_users_cached(_db: DatabaseManager) -> Dict:
+    """Users with departments and roles, keyed by user_id (cached across reruns)"""
+    with _db._get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT u.user_id, u.email, u.full_name,
+                       d.department_name as departments,
+                       r.role_name as roles
+                FROM users u
+                LEFT JOIN departments d ON u.department_id = d.department_id
+                LEFT JOIN roles r ON u.role_id = r.role_id
+                ORDER BY u.email
+            """)
+            return {row[0]: tuple(row) for row in cur.fetchall()}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _count_docs_cached(_db: DatabaseManager) -> int:
+    """Total number of documents (cached across reruns)"""
+    with _db._get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM documents")
+            return cur.fetchone()[0]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _count_chunks_cached(_db: DatabaseManager) -> int:
+    """Total number of chunks (cached across reruns)"""
+    with _db._get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM document_chunks")
+            return cur.fetchone()[0]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _count_user_docs_cached(_db: DatabaseManager, user_id: str) -> int:
+    """Number of documents uploaded by a user (cached across reruns)"""
+    with _db._get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) FROM documents WHERE uploaded_by = %s",
+                (user_id,),
+            )
+            return cur.fetchone()[0]
+
+
+@st.cache_resource
+def get_ingest_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for document ingestion (cached for performance)"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="ingest")
+
+
+def _clear_document_caches():
+    """Invalidate cached document stats and listings after an upload"""
+    _count_docs_cached.clear()
+    _count_chunks_cached.clear()
+    _count_user_docs_cached.clear()
+    _load_analytics_cached.clear()
+    _load_user_docs_cached.clear()
+
+
+def _ingest_upload(engine: SentinelEngine, tmp_path: str, **kwargs) -> str:
+    """Ingest a spooled upload on the worker, then remove its temp file"""
+    try:
+        doc_id = engine.ingest_documents(source=tmp_path, **kwargs)
+    finally:
+        os.unlink(tmp_path)
+
+    # Invalidate here so it still happens if the script run is interrupted
+    _clear_document_caches()
+    return doc_id
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_user_docs_cached(
+    _db: DatabaseManager,
+    user_id: str,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Dict]:
+    """Documents uploaded by a user (cached across reruns)"""
+    docs = _db.get_document_uploads_by_user(
+        user_id, search=search, limit=limit, offset=offset
+    )
+    return [dict(d) for d in docs]
+
+
 def render_header():
     """Render professional header"""
-    st.markdown(
-        """
-    <div class="header-container">
-        <h1 class="header-title">🛡️ Sentinel RAG</h1>
-        <p class="header-subtitle">Enterprise-Grade RAG with Intelligent Document Management & Semantic Search</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 
-def render_sidebar(settings):
+def render_sidebar(settings, db: DatabaseManager):
     """Render sidebar with user selection and stats"""
     with st.sidebar:
         st.markdown("### 👤 User Profile")
 
         # Get all users from database
-        _, db, _ = initialize_system()
-
         try:
-            with db._get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT u.user_id, u.email, u.full_name,
-                               STRING_AGG(DISTINCT d.department_name, ', ') as departments,
-                               STRING_AGG(DISTINCT r.role_name, ', ') as roles
-                        FROM users u
-                        LEFT JOIN user_access ua ON u.user_id = ua.user_id
-                        LEFT JOIN departments d ON ua.department_id = d.department_id
-                        LEFT JOIN roles r ON ua.role_id = r.role_id
-                        GROUP BY u.user_id, u.email, u.full_name
-                        ORDER BY u.email
-                    """)
-                    users = cur.fetchall()
+            users_by_id = _load_users_cached(db)
         except Exception as e:
             st.error(f"Error loading users: {e}")
-            users = []
+            users_by_id = {}
 
-        if not users:
+        if not users_by_id:
             st.warning("No users found in the system")
             return None
 
         # Create user selection dropdown
-        user_options = {f"{u[1]} ({u[2] or 'No name'})": u[0] for u in users}
+        user_options = {
+            f"{u[1]} ({u[2] or 'No name'})": u[0] for u in users_by_id.values()
+        }
         selected_user_display = st.selectbox(
             "Select User",
             options=list(user_options.keys()),
@@ -211,7 +364,7 @@ def render_sidebar(settings):
         selected_user_id = user_options[selected_user_display]
 
         # Display user info
-        selected_user = next(u for u in users if u[0] == selected_user_id)
+        selected_user = users_by_id[selected_user_id]
 
         st.markdown("---")
         st.markdown("**User Details:**")
@@ -231,22 +384,9 @@ def render_sidebar(settings):
         st.markdown("### 📊 Quick Stats")
 
         try:
-            with db._get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Total documents
-                    cur.execute("SELECT COUNT(*) FROM documents")
-                    total_docs = cur.fetchone()[0]
-
-                    # Total chunks
-                    cur.execute("SELECT COUNT(*) FROM document_chunks")
-                    total_chunks = cur.fetchone()[0]
-
-                    # User's documents
-                    cur.execute(
-                        "SELECT COUNT(*) FROM documents WHERE uploaded_by = %s",
-                        (selected_user_id,),
-                    )
-                    user_docs = cur.fetchone()[0]
+            total_docs = _count_docs_cached(db)
+            total_chunks = _count_chunks_cached(db)
+            user_docs = _count_user_docs_cached(db, selected_user_id)
 
             st.metric("Total Documents", total_docs)
             st.metric("Total Chunks", total_chunks)
@@ -258,19 +398,29 @@ def render_sidebar(settings):
         return selected_user_id
 
 
-def render_upload_tab(user_id: str, engine: SentinelEngine, settings):
+@st.fragment
+def render_upload_tab(
+    user_id: str, engine: SentinelEngine, db: DatabaseManager, settings
+):
     """Render document upload interface"""
     st.markdown("## 📤 Upload Documents")
     st.markdown(
         "Upload documents to the knowledge base with metadata and access controls."
     )
 
+    # Outcome of the last upload, carried across the rerun that follows it
+    for kind, message in st.session_state.pop("upload_messages", []):
+        getattr(st, kind)(message)
+    if st.session_state.pop("upload_balloons", False):
+        st.balloons()
+
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        uploaded_file = st.file_uploader(
-            "Choose a file",
+        uploaded_files = st.file_uploader(
+            "Choose files",
             type=["pdf", "docx", "txt", "md", "html", "xlsx", "pptx"],
+            accept_multiple_files=True,
             help="Supported formats: PDF, DOCX, TXT, MD, HTML, XLSX, PPTX",
         )
 
@@ -281,17 +431,23 @@ def render_upload_tab(user_id: str, engine: SentinelEngine, settings):
             help="Enable parent-document retrieval for better context",
         )
 
-    if uploaded_file:
+    if uploaded_files:
         st.markdown("### 📋 Document Metadata")
 
         col1, col2 = st.columns(2)
 
         with col1:
-            doc_title = st.text_input(
-                "Document Title*",
-                value=uploaded_file.name,
-                help="Descriptive title for the document",
-            )
+            if len(uploaded_files) == 1:
+                doc_title = st.text_input(
+                    "Document Title*",
+                    value=uploaded_files[0].name,
+                    help="Descriptive title for the document",
+                )
+            else:
+                doc_title = None
+                st.caption(
+                    f"{len(uploaded_files)} files selected; each is titled by its file name."
+                )
 
             doc_department = st.selectbox(
                 "Department*",
@@ -308,24 +464,23 @@ def render_upload_tab(user_id: str, engine: SentinelEngine, settings):
 
             doc_classification = st.selectbox(
                 "Classification Level*",
-                options=["public", "internal", "confidential"],
+                options=CLASSIFICATION_OPTIONS,
                 help="Access level for this document",
             )
 
         st.markdown("---")
 
         if st.button(
-            "🚀 Upload & Process Document", type="primary", use_container_width=True
+            "🚀 Upload & Process Documents", type="primary", use_container_width=True
         ):
-            if not doc_title or not doc_description:
+            if (len(uploaded_files) == 1 and not doc_title) or not doc_description:
                 st.error("❌ Please fill in all required fields (marked with *)")
                 return
 
-            with st.spinner("Processing document... This may take a moment."):
+            # Temp files not yet handed to a worker; workers remove their own
+            unsubmitted = []
+            with st.spinner("Processing documents... This may take a moment."):
                 try:
-                    # Get database instance
-                    _, db, _ = initialize_system()
-
                     # Convert department name to department_id
                     dept_id = db.get_department_id_by_name(doc_department)
                     if not dept_id:
@@ -334,38 +489,103 @@ def render_upload_tab(user_id: str, engine: SentinelEngine, settings):
                         )
                         return
 
-                    # Create a temporary file
-                    with tempfile.NamedTemporaryFile(
-                        delete=False, suffix=Path(uploaded_file.name).suffix
-                    ) as tmp:
-                        tmp.write(uploaded_file.getvalue())
-                        tmp_path = tmp.name
-
-                    # Process document
-                    doc_id = engine.ingest_documents(
-                        source=tmp_path,
-                        title=doc_title,
-                        description=doc_description,
-                        user_id=user_id,
-                        department_id=dept_id,  # Use UUID instead of name
-                        classification=doc_classification,
-                        use_hierarchical=use_hierarchical,
-                    )
-
-                    # Clean up
-                    os.unlink(tmp_path)
+                    # Spool each upload to a temporary file and queue its ingestion
+                    futures = {}
+                    for uploaded_file in uploaded_files:
+                        with tempfile.NamedTemporaryFile(
+                            delete=False, suffix=Path(uploaded_file.name).suffix
+                        ) as tmp:
+                            uploaded_file.seek(0)
+                            shutil.copyfileobj(uploaded_file, tmp, length=1024 * 1024)
+                            unsubmitted.append(tmp.name)
+
+                        # Process documents off the script thread
+                        future = get_ingest_executor().submit(
+                            _ingest_upload,
+                            engine,
+                            tmp.name,
+                            title=doc_title or uploaded_file.name,
+                            description=doc_description,
+                            user_id=user_id,
+                            department_id=dept_id,  # Use UUID instead of name
+                            classification=doc_classification,
+                            use_hierarchical=use_hierarchical,
+                        )
+                        unsubmitted.remove(tmp.name)
+                        futures[future] = uploaded_file.name
+
+                    progress = st.progress(0.0, "Ingesting documents...")
+                    while not all(f.done() for f in futures):
+                        time.sleep(0.5)
+                        done = sum(f.done() for f in futures)
+                        progress.progress(
+                            done / len(futures),
+                            f"Ingested {done} of {len(futures)} documents...",
+                        )
+                    progress.empty()
+
+                    messages = []
+                    for future, filename in futures.items():
+                        try:
+                            doc_id = future.result()
+                        except Exception as e:
+                            messages.append(
+                                ("error", f"❌ Upload failed for {filename}: {str(e)}")
+                            )
+                        else:
+                            messages.append(
+                                (
+                                    "success",
+                                    f"✅ {filename} successfully uploaded! Document ID: `{doc_id}`",
+                                )
+                            )
+                    st.session_state["upload_messages"] = messages
 
-                    st.success(
-                        f"✅ Document successfully uploaded! Document ID: `{doc_id}`"
-                    )
-                    st.balloons()
+                    if any(kind == "success" for kind, _ in messages):
+                        st.session_state["upload_balloons"] = True
+                        # Rerun the whole app so the sidebar stats and the
+                        # document library pick up the cleared caches
+                        st.rerun()
+                    st.rerun(scope="fragment")
 
                 except Exception as e:
                     st.error(f"❌ Upload failed: {str(e)}")
-                    if "tmp_path" in locals() and os.path.exists(tmp_path):
-                        os.unlink(tmp_path)
+                finally:
+                    # Clean up
+                    for tmp_path in unsubmitted:
+                        if os.path.exists(tmp_path):
+                            os.unlink(tmp_path)
+
+
+def _render_results_html(results, start: int = 1) -> str:
+    """Build the HTML for all search result cards in one string"""
+    cards = []
+    for idx, doc in enumerate(results, start):
+        meta = doc.metadata
+        ids = [
+            ID_ITEM_TEMPLATE.format(label, html.escape(str(meta[key])))
+            for label, key in RESULT_ID_FIELDS
+            if key in meta
+        ]
+
+        # Blank lines would end the markdown HTML block, so encode newlines
+        content = html.escape(doc.page_content).replace("\n", "&#10;")
+
+        cards.append(
+            RESULT_CARD_TEMPLATE.format(
+                idx=idx,
+                title=html.escape(str(meta.get("title", "Untitled"))),
+                department=html.escape(str(meta.get("department_id", "N/A"))),
+                classification=html.escape(str(meta.get("classification", "N/A"))),
+                similarity=meta.get("similarity_score", 0),
+                ids="".join(ids),
+                content=content,
+            )
+        )
+    return "".join(cards)
 
 
+@st.fragment
 def render_search_tab(user_id: str, engine: SentinelEngine):
     """Render intelligent search interface"""
     st.markdown("## 🔍 Intelligent Search")
@@ -373,25 +593,29 @@ def render_search_tab(user_id: str, engine: SentinelEngine):
         "Search across documents you have access to with semantic understanding."
     )
 
-    col1, col2 = st.columns([4, 1])
+    # Only search on submit, not on every widget change
+    with st.form("search_form", border=False):
+        col1, col2 = st.columns([4, 1])
 
-    with col1:
-        query = st.text_input(
-            "Enter your question",
-            placeholder="e.g., What are the company's remote work policies?",
-            label_visibility="collapsed",
-        )
+        with col1:
+            query = st.text_input(
+                "Enter your question",
+                placeholder="e.g., What are the company's remote work policies?",
+                label_visibility="collapsed",
+            )
 
-    with col2:
-        use_parent = st.checkbox(
-            "Parent Retrieval",
-            value=False,
-            help="Use parent document retrieval for better context",
+        with col2:
+            use_parent = st.checkbox(
+                "Parent Retrieval",
+                value=False,
+                help="Use parent document retrieval for better context",
+            )
+
+        submitted = st.form_submit_button(
+            "🔎 Search", type="primary", use_container_width=True
         )
 
-    if st.button("🔎 Search", type="primary", use_container_width=True) or (
-        query and len(query) > 3
-    ):
+    if submitted:
         if not query or len(query) < 3:
             st.warning("⚠️ Please enter a query with at least 3 characters")
             return
@@ -410,151 +634,191 @@ def render_search_tab(user_id: str, engine: SentinelEngine):
 
                 st.markdown(f"### 📚 Found {len(results)} relevant results")
 
-                for idx, doc in enumerate(results, 1):
-                    with st.container():
+                st.markdown(
+                    _render_results_html(results[:INITIAL_RESULTS]),
+                    unsafe_allow_html=True,
+                )
+
+                if len(results) > INITIAL_RESULTS:
+                    with st.expander(
+                        f"Show {len(results) - INITIAL_RESULTS} more results"
+                    ):
                         st.markdown(
-                            f"""
-                        <div class="result-card">
-                            <h4>📄 Result {idx}: {doc.metadata.get("title", "Untitled")}</h4>
-                        </div>
-                        """,
+                            _render_results_html(
+                                results[INITIAL_RESULTS:], start=INITIAL_RESULTS + 1
+                            ),
                             unsafe_allow_html=True,
                         )
 
-                        # Create columns for metadata and content
-                        meta_col, content_col = st.columns([1, 2])
-
-                        with meta_col:
-                            st.markdown("**Metadata:**")
-                            st.markdown(
-                                f"- **Department:** {doc.metadata.get('department_id', 'N/A')}"
-                            )
-                            st.markdown(
-                                f"- **Classification:** {doc.metadata.get('classification', 'N/A')}"
-                            )
-                            st.markdown(
-                                f"- **Similarity:** {doc.metadata.get('similarity_score', 0):.2%}"
-                            )
-
-                            if "chunk_id" in doc.metadata:
-                                st.markdown(
-                                    f"- **Chunk ID:** `{doc.metadata['chunk_id']}`"
-                                )
-                            if "parent_chunk_id" in doc.metadata:
-                                st.markdown(
-                                    f"- **Parent ID:** `{doc.metadata['parent_chunk_id']}`"
-                                )
-
-                        with content_col:
-                            st.markdown("**Content:**")
-                            st.markdown(f"```\n{doc.page_content}\n```")
-
-                        st.markdown("---")
-
             except Exception as e:
                 st.error(f"❌ Search failed: {str(e)}")
 
 
+@st.fragment
 def render_documents_tab(user_id: str, db: DatabaseManager):
     """Render document management interface"""
     st.markdown("## 📚 Document Library")
     st.markdown("View and manage your uploaded documents.")
 
+    # Clear before anything is read so the count and empty state refresh too
+    if st.button("🔄 Refresh"):
+        _count_user_docs_cached.clear()
+        _load_user_docs_cached.clear()
+
     try:
-        docs = db.get_document_uploads_by_user(user_id)
+        total_docs = _count_user_docs_cached(db, user_id)
 
-        if not docs:
+        if not total_docs:
             st.info(
                 "ℹ️ You haven't uploaded any documents yet. Go to the Upload tab to add documents."
             )
             return
 
-        st.markdown(f"### You have uploaded **{len(docs)}** document(s)")
+        st.markdown(f"### You have uploaded **{total_docs}** document(s)")
 
         # Create search filter
         search_filter = st.text_input(
             "🔍 Filter documents", placeholder="Search by title or description..."
         )
 
-        filtered_docs = docs
-        if search_filter:
-            filtered_docs = [
-                d
-                for d in docs
-                if search_filter.lower() in d["title"].lower()
-                or search_filter.lower() in (d["description"] or "").lower()
-            ]
-
-        for doc in filtered_docs:
-            with st.container():
-                col1, col2, col3 = st.columns([3, 1, 1])
-
-                with col1:
-                    st.markdown(
-                        f"""
-                    <div class="doc-card">
-                        <h4>📄 {doc["title"]}</h4>
-                        <p style="color: #666; margin: 0.5rem 0;">{doc["description"] or "No description"}</p>
-                        <small style="color: #999;">Uploaded: {doc["created_at"].strftime("%Y-%m-%d %H:%M")}</small>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
-
-                with col2:
-                    st.markdown("**Department:**")
-                    st.markdown(doc["department_name"])
-
-                with col3:
-                    classification_colors = {
-                        "public": "🟢",
-                        "internal": "🟡",
-                        "confidential": "🔴",
-                    }
-                    st.markdown("**Classification:**")
-                    st.markdown(
-                        f"{classification_colors.get(doc['classification'], '⚪')} {doc['classification']}"
-                    )
+        # Filter in SQL; patterns under three characters skip the trigram index
+        search = search_filter or None
 
-                # Get chunk count for this document
-                with db._get_connection() as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            "SELECT COUNT(*) FROM document_chunks WHERE doc_id = %s",
-                            (doc["doc_id"],),
-                        )
-                        chunk_count = cur.fetchone()[0]
+        # Start from the first page whenever the user or the filter changes
+        if (
+            st.session_state.get("docs_user") != user_id
+            or st.session_state.get("docs_search") != search
+        ):
+            st.session_state.docs_user = user_id
+            st.session_state.docs_search = search
+            st.session_state.docs_page = 0
+        page = st.session_state.get("docs_page", 0)
+
+        # Fetch one extra row to learn whether a next page exists
+        filtered_docs = _load_user_docs_cached(
+            db, user_id, search, limit=DOCS_PAGE_SIZE + 1, offset=page * DOCS_PAGE_SIZE
+        )
+        has_next = len(filtered_docs) > DOCS_PAGE_SIZE
+        filtered_docs = filtered_docs[:DOCS_PAGE_SIZE]
 
-                st.markdown(f"*Contains {chunk_count} chunks*")
-                st.markdown("---")
+        # Get chunk counts for all listed documents in one round-trip
+        chunk_counts = {}
+        if filtered_docs:
+            with db._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        SELECT doc_id::text, COUNT(*)
+                        FROM document_chunks
+                        WHERE doc_id = ANY(%s::uuid[])
+                        GROUP BY doc_id
+                        """,
+                        ([str(d["doc_id"]) for d in filtered_docs],),
+                    )
+                    chunk_counts = dict(cur.fetchall())
+
+        cards = "".join(
+            DOC_CARD_TEMPLATE.format(
+                title=html.escape(doc["title"] or "Untitled"),
+                description=html.escape(doc["description"] or "No description"),
+                uploaded=doc["created_at"].strftime("%Y-%m-%d %H:%M"),
+                department=html.escape(doc["department_name"] or "N/A"),
+                classification_icon=CLASSIFICATION_COLORS.get(
+                    doc["classification"], "⚪"
+                ),
+                classification=html.escape(doc["classification"] or "N/A"),
+                chunk_count=chunk_counts.get(str(doc["doc_id"]), 0),
+            )
+            for doc in filtered_docs
+        )
+        st.markdown(cards, unsafe_allow_html=True)
+
+        if page > 0 or has_next:
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                if st.button("◀ Previous", disabled=page == 0, key="docs_prev"):
+                    st.session_state.docs_page = page - 1
+                    st.rerun(scope="fragment")
+            with page_col:
+                st.markdown(f"<center>Page {page + 1}</center>", unsafe_allow_html=True)
+            with next_col:
+                if st.button("Next ▶", disabled=not has_next, key="docs_next"):
+                    st.session_state.docs_page = page + 1
+                    st.rerun(scope="fragment")
 
     except Exception as e:
         st.error(f"❌ Error loading documents: {str(e)}")
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_analytics_cached(_db: DatabaseManager) -> dict:
+    """System-wide analytics in one connection checkout (cached across reruns)"""
+    with _db._get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                WITH doc_stats AS (
+                    SELECT
+                        COUNT(*) as total_docs,
+                        COUNT(DISTINCT department_id) as active_departments
+                    FROM documents
+                ),
+                chunk_stats AS (
+                    SELECT COUNT(*) as total_chunks FROM document_chunks
+                ),
+                user_stats AS (
+                    SELECT COUNT(*) as total_users FROM users
+                )
+                SELECT ds.total_docs, cs.total_chunks,
+                       us.total_users, ds.active_departments
+                FROM doc_stats ds, chunk_stats cs, user_stats us
+            """)
+            stats = cur.fetchone()
+
+            cur.execute("""
+                SELECT classification, COUNT(*) as count,
+                       (SUM(COUNT(*)) OVER ())::bigint as total
+                FROM documents
+                GROUP BY classification
+                ORDER BY count DESC
+            """)
+            classification_data = cur.fetchall()
+
+            cur.execute("""
+                SELECT d.title, d.created_at, u.email, dept.department_name, d.classification
+                FROM documents d
+                JOIN users u ON d.uploaded_by = u.user_id
+                JOIN departments dept ON d.department_id = dept.department_id
+                ORDER BY d.created_at DESC
+                LIMIT 10
+            """)
+            recent_docs = cur.fetchall()
+
+    return {
+        "stats": tuple(stats[:2]) if stats else None,
+        "total_users": stats[2] if stats else 0,
+        "active_departments": stats[3] if stats else 0,
+        "classification_data": [tuple(row) for row in classification_data],
+        "recent_docs": [tuple(row) for row in recent_docs],
+    }
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape markdown metacharacters so text renders literally in a table cell"""
+    return re.sub(r"([\\`*_{}\[\]()<>#+\-.!|~$])", r"\\\1", " ".join(text.split()))
+
+
 def render_analytics_tab(db: DatabaseManager):
     """Render analytics dashboard"""
     st.markdown("## 📊 Analytics Dashboard")
     st.markdown("System-wide statistics and insights.")
 
     try:
-        with db._get_connection() as conn:
-            with conn.cursor() as cur:
-                # Get various statistics
-                cur.execute("""
-                    SELECT 
-                        COUNT(DISTINCT doc_id) as total_docs,
-                        COUNT(*) as total_chunks,
-                        AVG(LENGTH(content)) as avg_chunk_size
-                    FROM document_chunks
-                """)
-                stats = cur.fetchone()
-
-                cur.execute("SELECT COUNT(*) FROM users")
-                total_users = cur.fetchone()[0]
-
-                cur.execute("SELECT COUNT(DISTINCT department_id) FROM documents")
-                active_departments = cur.fetchone()[0]
+        analytics = _load_analytics_cached(db)
+        stats = analytics["stats"]
+        total_users = analytics["total_users"]
+        active_departments = analytics["active_departments"]
+        classification_data = analytics["classification_data"]
+        recent_docs = analytics["recent_docs"]
 
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -574,58 +838,35 @@ def render_analytics_tab(db: DatabaseManager):
         st.markdown("---")
 
         # Document distribution by classification
-        with db._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT classification, COUNT(*) as count
-                    FROM documents
-                    GROUP BY classification
-                    ORDER BY count DESC
-                """)
-                classification_data = cur.fetchall()
-
         if classification_data:
             st.markdown("### 📊 Documents by Classification")
 
             col1, col2 = st.columns([2, 1])
 
             with col1:
-                for classification, count in classification_data:
-                    percentage = (
-                        (count / stats[0] * 100) if stats and stats[0] > 0 else 0
-                    )
+                for classification, count, total in classification_data:
+                    percentage = (count / total * 100) if total else 0
                     st.progress(
                         percentage / 100,
                         f"{classification.upper()}: {count} documents ({percentage:.1f}%)",
                     )
 
             with col2:
-                for classification, count in classification_data:
+                for classification, count, _ in classification_data:
                     st.markdown(f"**{classification}:** {count}")
 
         # Recent uploads
         st.markdown("### 📅 Recent Uploads")
-        with db._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT d.title, d.created_at, u.email, dept.department_name, d.classification
-                    FROM documents d
-                    JOIN users u ON d.uploaded_by = u.user_id
-                    JOIN departments dept ON d.department_id = dept.department_id
-                    ORDER BY d.created_at DESC
-                    LIMIT 10
-                """)
-                recent_docs = cur.fetchall()
-
         if recent_docs:
-            for doc in recent_docs:
-                col1, col2, col3 = st.columns([2, 1, 1])
-                with col1:
-                    st.markdown(f"**{doc[0]}**")
-                with col2:
-                    st.markdown(f"*{doc[2]}*")
-                with col3:
-                    st.markdown(f"_{doc[1].strftime('%Y-%m-%d %H:%M')}_")
+            rows = "\n".join(
+                "| **{}** | *{}* | _{}_ |".format(
+                    _escape_markdown(doc[0] or "Untitled"),
+                    _escape_markdown(doc[2]),
+                    doc[1].strftime("%Y-%m-%d %H:%M"),
+                )
+                for doc in recent_docs
+            )
+            st.markdown(f"| Title | Uploaded by | Date |\n|---|---|---|\n{rows}")
         else:
             st.info("No recent uploads")
 
@@ -642,7 +883,7 @@ def main():
     render_header()
 
     # Render sidebar and get selected user
-    user_id = render_sidebar(settings)
+    user_id = render_sidebar(settings, db)
 
     if not user_id:
         st.error("⚠️ No user selected. Please create users first.")
@@ -657,7 +898,7 @@ def main():
         render_search_tab(user_id, engine)
 
     with tab2:
-        render_upload_tab(user_id, engine, settings)
+        render_upload_tab(user_id, engine, db, settings)
 
     with tab3:
         render_documents_tab(user_id, db)
@@ -4,6 +4,7 @@ Application factory and FastAPI app initialization for sentinel-rag.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from .dependencies import get_app_state, app_lifespan
@@ -42,6 +43,9 @@ def create_application() -> FastAPI:
         allow_headers=settings.cors.allow_headers,
     )
 
+    # Query results carry chunk text, which compresses well on the wire
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
     app.add_middleware(
         SessionMiddleware,
         secret_key=settings.security.secret_key,
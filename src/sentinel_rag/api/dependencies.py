@@ -72,7 +72,11 @@ class AppState:
             return
 
         # Initialize PostgreSQL database
-        self.db = DatabaseManager(settings.database.dsn)
+        self.db = DatabaseManager(
+            settings.database.dsn,
+            min_pool_size=settings.database.min_pool_size,
+            max_pool_size=settings.database.max_pool_size,
+        )
 
         # Initialize Qdrant vector store
         self.vector_store = QdrantStore(
@@ -6,8 +6,8 @@ documents uploaded by the user.
 
 """
 
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
 
 from sentinel_rag.api.dependencies import DatabaseDep, get_current_active_user
 from sentinel_rag.services.auth import UserContext
@@ -36,12 +36,17 @@ async def get_user(
 async def get_user_documents(
     db: DatabaseDep,
     user: UserContext = Depends(get_current_active_user),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
 ):
     """
-    Get all documents uploaded by a current user.
+    Get documents uploaded by a current user.
 
     Returns a list of document metadata for documents
-    the specified user has uploaded.
+    the specified user has uploaded, newest first. Pass
+    limit/offset to page through large libraries.
     """
-    documents = db.get_document_uploads_by_user(user_id=str(user.user_id))
+    documents = db.get_document_uploads_by_user(
+        user_id=str(user.user_id), limit=limit, offset=offset
+    )
     return documents
@@ -17,11 +17,15 @@ from .exceptions import DatabaseError
 
 
 class DatabaseManager:
-    _MIN_POOL_SIZE = 2
-    _MAX_POOL_SIZE = 10
-
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        min_pool_size: int = 2,
+        max_pool_size: int = 10,
+    ):
         self.connection_params = psycopg2.extensions.parse_dsn(database_url)
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
         self._pool = None
         self._init_tables()
         self._init_pool()
@@ -30,7 +34,7 @@ class DatabaseManager:
         """Initialize connection pool."""
         try:
             self._pool = pool.ThreadedConnectionPool(
-                self._MIN_POOL_SIZE, self._MAX_POOL_SIZE, **self.connection_params
+                self.min_pool_size, self.max_pool_size, **self.connection_params
             )
         except Exception as e:
             raise DatabaseError(f"Failed to initialize connection pool: {e}")
@@ -126,23 +130,49 @@ class DatabaseManager:
                 )
                 return cur.fetchone()
 
-    def get_document_uploads_by_user(self, user_id: str) -> List[Dict]:
+    def get_document_uploads_by_user(
+        self,
+        user_id: str,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict]:
+        """Documents uploaded by a user, newest first, optionally filtered and paginated."""
+        query = """
+            SELECT d.doc_id, d.filename, d.title, d.description, 
+                   d.classification, d.created_at, dept.department_name
+            FROM documents d
+            JOIN departments dept ON d.department_id = dept.department_id
+            WHERE d.uploaded_by = %s
+        """
+        params = [user_id]
+
+        if search:
+            pattern = (
+                "%"
+                + (search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_"))
+                + "%"
+            )
+            query += " AND (d.title ILIKE %s OR d.description ILIKE %s)"
+            params.extend([pattern, pattern])
+
+        query += " ORDER BY d.created_at DESC"
+
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        if offset:
+            query += " OFFSET %s"
+            params.append(offset)
+
         with self._get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(
-                    """
-                    SELECT d.doc_id, d.filename, d.title, d.description, 
-                           d.classification, d.created_at, dept.department_name
-                    FROM documents d
-                    JOIN departments dept ON d.department_id = dept.department_id
-                    WHERE d.uploaded_by = %s
-                    ORDER BY d.created_at DESC
-                    """,
-                    (user_id,),
-                )
+                cur.execute(query, params)
                 return cur.fetchall()
 
-    def get_role_dept_id_by_name(self, role_name: str, department_name: str) -> Optional[tuple]:
+    def get_role_dept_id_by_name(
+        self, role_name: str, department_name: str
+    ) -> Optional[tuple]:
         with self._get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
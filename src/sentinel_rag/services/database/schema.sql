@@ -1,4 +1,5 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- ========================================================
 --             User and RBAC Management
@@ -113,3 +114,7 @@ CREATE INDEX IF NOT EXISTS idx_m2m_clients_active ON m2m_clients(is_active) WHER
 -- GIN Index for fast metadata filtering
 CREATE INDEX IF NOT EXISTS idx_documents_metadata ON documents USING GIN (metadata);
 CREATE INDEX IF NOT EXISTS idx_document_chunks_metadata ON document_chunks USING GIN (metadata);
+
+-- Trigram indexes for substring filtering of the document library
+CREATE INDEX IF NOT EXISTS idx_documents_title_trgm ON documents USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_documents_description_trgm ON documents USING GIN (description gin_trgm_ops);
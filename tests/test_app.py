@@ -0,0 +1,46 @@
+"""
+Test suite for application-level middleware.
+
+Coverage:
+- Gzip compression of large responses
+- Small responses left uncompressed
+
+Test types: Integration
+"""
+
+import pytest
+
+
+#                      RESPONSE COMPRESSION TESTS
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+class TestResponseCompression:
+    """Test suite for the GZip middleware."""
+
+    def test_large_response_is_gzip_encoded(self, client):
+        """Verify responses above the size threshold are gzip-compressed."""
+
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert "paths" in response.json()
+
+    def test_small_health_responses_are_not_compressed(self, client):
+        """Verify health responses below the size threshold stay uncompressed."""
+
+        for path in ("/", "/health"):
+            response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+            assert response.status_code == 200
+            assert "content-encoding" not in response.headers
+
+    def test_response_not_compressed_without_accept_encoding(self, client):
+        """Verify clients that do not accept gzip get a plain response."""
+
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
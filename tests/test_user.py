@@ -195,6 +195,44 @@ class TestGetUserDocumentsEndpoint:
             data = response.json()
             assert isinstance(data, list), "Response should be a list"
 
+    def test_user_documents_accepts_pagination(self, admin_client):
+        """Verify user documents endpoint accepts limit/offset parameters."""
+
+        response = admin_client.post("/api/user/docs", params={"limit": 5, "offset": 0})
+
+        assert response.status_code != 404, "Endpoint should exist"
+        assert response.status_code != 401, "Should be authenticated"
+        if response.status_code == 200:
+            data = response.json()
+            assert isinstance(data, list), "Response should be a list"
+            assert len(data) <= 5, "Response should respect the limit"
+
+    def test_user_documents_offset_skips_leading_documents(self, admin_client):
+        """Verify offset pages through the list with and without a limit."""
+
+        full = admin_client.post("/api/user/docs")
+
+        # Assert - Only comparable when the unpaged listing is available
+        if full.status_code == 200:
+            doc_ids = [doc["doc_id"] for doc in full.json()]
+
+            paged = admin_client.post(
+                "/api/user/docs", params={"limit": 2, "offset": 1}
+            )
+            assert paged.status_code == 200
+            assert [doc["doc_id"] for doc in paged.json()] == doc_ids[1:3]
+
+            skipped = admin_client.post("/api/user/docs", params={"offset": 1})
+            assert skipped.status_code == 200
+            assert [doc["doc_id"] for doc in skipped.json()] == doc_ids[1:]
+
+    def test_user_documents_invalid_limit_returns_422(self, admin_client):
+        """Verify user documents endpoint rejects out-of-range limits."""
+
+        response = admin_client.post("/api/user/docs", params={"limit": 0})
+
+        assert response.status_code == 422
+
     def test_user_documents_requires_authentication(self, client):
         """Verify user documents endpoint requires authentication."""
 